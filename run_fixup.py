@@ -36,7 +36,6 @@ Usage:
 
 from __future__ import annotations
 
-import argparse
 import atexit
 import configparser
 import fnmatch
@@ -56,8 +55,25 @@ from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:  # 仅用于注解；argparse 只在 CLI 入口 parse_args 中按需导入，缩短模块冷启动
+    import argparse
 
 try:
     from comparator_reliability import (
@@ -727,10 +743,15 @@ def format_progress_label(current: int, total: int, width: Optional[int] = None)
 def safe_first_line(text: Optional[str], limit: int = 160, default: str = "") -> str:
     if not text:
         return default
-    lines = text.splitlines()
-    if not lines:
-        return default
-    return lines[0][:limit]
+    # 常见的短消息（不超过 limit）保持原有 splitlines 路径，它对短文本最快
+    if len(text) <= limit or limit < 0:
+        lines = text.splitlines()
+        if not lines:
+            return default
+        return lines[0][:limit]
+    # 长文本只在前 limit+1 个字符内查找行边界（与 str.splitlines 一致），不切分整段文本
+    match = RE_LINE_BOUNDARY.search(text, 0, limit + 1)
+    return text[: match.start()] if match else text[:limit]
 
 
 init_console_logging()
@@ -843,24 +864,8 @@ def classify_sql_error(stderr: str) -> str:
 
     stderr_upper = stderr.upper()
 
-    # Missing object errors (retryable - object may be created in later rounds)
-    if any(
-        code in stderr_upper
-        for code in [
-            "ORA-00942",
-            "ORA-04043",
-            "OB-00942",
-            "OB-04043",
-            "OBE-00942",
-            "OBE-04043",
-            "ORA-06512",
-        ]
-    ):
-        if (
-            "TABLE OR VIEW DOES NOT EXIST" in stderr_upper
-            or "OBJECT DOES NOT EXIST" in stderr_upper
-        ):
-            return FailureType.MISSING_OBJECT
+    # Missing object errors (retryable - object may be created in later rounds).
+    # ORA/OB-00942/04043 only count with the "does not exist" text, which is matched here directly.
     if (
         "TABLE OR VIEW DOES NOT EXIST" in stderr_upper
         or "OBJECT DOES NOT EXIST" in stderr_upper
@@ -1462,6 +1467,8 @@ RE_QUOTED_DOT = re.compile(r"'([A-Za-z0-9_#$]+\.[A-Za-z0-9_#$]+)'")
 RE_DOUBLE_QUOTED_DOT = re.compile(r'"([A-Za-z0-9_#$]+)"\."([A-Za-z0-9_#$]+)"')
 RE_PLAIN_DOT = re.compile(r"([A-Za-z0-9_#$]+)\.([A-Za-z0-9_#$]+)")
 RE_SINGLE_QUOTED_NAME = re.compile(r"'([A-Za-z0-9_#$]+)'")
+# 与 str.splitlines() 相同的行边界集合
+RE_LINE_BOUNDARY = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 RE_BLOCK_START = re.compile(
     r"^\s*CREATE\s+(OR\s+REPLACE\s+)?"
     r"(PROCEDURE|FUNCTION|PACKAGE(\s+BODY)?|TYPE(\s+BODY)?|TRIGGER)\b",
@@ -1497,7 +1504,19 @@ RE_GRANT_SIMPLE = re.compile(
     r"^\s*GRANT\s+(?P<privs>.+?)\s+TO\s+(?P<grantees>.+)$", re.IGNORECASE | re.DOTALL
 )
 RE_WITH_OPTION = re.compile(r"\s+WITH\s+GRANT\s+OPTION|\s+WITH\s+ADMIN\s+OPTION", re.IGNORECASE)
+# split_sql_statements 各扫描状态下不会改变状态的连续字符，可整段追加
+RE_SQL_SPLIT_PLAIN = re.compile(r"[^qQ/\-;'\"]+")
+RE_SQL_SPLIT_PLAIN_IN_SINGLE = re.compile(r"[^']+")
+RE_SQL_SPLIT_PLAIN_IN_DOUBLE = re.compile(r'[^"]+')
+RE_SQL_SPLIT_PLAIN_IN_COMMENT = re.compile(r"[^/*]+")
+RE_VIEW_DDL_FORCE_EDITION = re.compile(
+    r"(?is)\bNO\s+FORCE\b|\bFORCE\b|\bEDITIONABLE\b|\bNONEDITIONABLE\b"
+)
+VIEW_DDL_HEADER_STOP_WORDS = frozenset({"VIEW", "AS", "SELECT", "WITH"})
 RE_CHAIN_NODE = re.compile(r"(?P<name>[^\[]+)\[(?P<meta>[^\]]+)\]")
+RE_DEPENDENCY_CHAIN_LINE = re.compile(
+    r"^\s*(?:\d+\.)?\s*(?P<dep>[^()]+)\((?P<dep_type>[^)]+)\)\s*->\s*(?P<ref>[^()]+)\((?P<ref_type>[^)]+)\)"
+)
 
 Q_QUOTE_DELIMS = {
     "[": "]",
@@ -1703,6 +1722,9 @@ def read_sql_text_with_limit(
 def extract_sql_error(output: str) -> Optional[str]:
     if not output:
         return None
+    # RE_SQL_ERROR 覆盖所有打分正则：整段输出一次扫描未命中即可跳过逐行打分
+    if not RE_SQL_ERROR.search(output):
+        return None
 
     best_line: Optional[str] = None
     best_score = -1
@@ -1741,8 +1763,13 @@ def score_execution_error_line(line: str) -> Optional[int]:
     return None
 
 
-def _scan_sql_word_tokens(sql_text: str) -> List[Tuple[str, int, int]]:
-    """Scan SQL words outside literals/comments; returns (UPPER_WORD, start, end)."""
+def _scan_sql_word_tokens(
+    sql_text: str, stop_words: Optional[FrozenSet[str]] = None
+) -> List[Tuple[str, int, int]]:
+    """Scan SQL words outside literals/comments; returns (UPPER_WORD, start, end).
+
+    When stop_words is given, scanning ends right after the first token found in it.
+    """
     tokens: List[Tuple[str, int, int]] = []
     i = 0
     n = len(sql_text or "")
@@ -1833,8 +1860,10 @@ def _scan_sql_word_tokens(sql_text: str) -> List[Tuple[str, int, int]]:
                     i += 1
                     continue
                 break
-            word = sql_text[start:i]
-            tokens.append((word.upper(), start, i))
+            word_u = sql_text[start:i].upper()
+            tokens.append((word_u, start, i))
+            if stop_words and word_u in stop_words:
+                break
             continue
         i += 1
     return tokens
@@ -1878,7 +1907,8 @@ def detect_session_sensitive_reason(sql_text: str) -> Optional[str]:
 def sanitize_view_chain_view_ddl(ddl_text: str) -> str:
     if not ddl_text:
         return ddl_text
-    tokens = _scan_sql_word_tokens(ddl_text)
+    # 只需要 CREATE ... VIEW 头部：扫到 VIEW/AS/SELECT/WITH 即停，不再分词整段视图定义
+    tokens = _scan_sql_word_tokens(ddl_text, VIEW_DDL_HEADER_STOP_WORDS)
     if not tokens or tokens[0][0] != "CREATE":
         return ddl_text
     idx = 1
@@ -1900,9 +1930,7 @@ def sanitize_view_chain_view_ddl(ddl_text: str) -> str:
     view_end = tokens[view_idx][2]
     mid_start = tokens[idx - 1][2] if has_or_replace else tokens[0][2]
     mid = ddl_text[mid_start : tokens[view_idx][1]]
-    mid_clean = re.sub(
-        r"(?is)\bNO\s+FORCE\b|\bFORCE\b|\bEDITIONABLE\b|\bNONEDITIONABLE\b", " ", mid
-    )
+    mid_clean = RE_VIEW_DDL_FORCE_EDITION.sub(" ", mid)
     mid_clean = " ".join(mid_clean.split())
     prefix = "CREATE"
     if has_or_replace:
@@ -2072,26 +2100,19 @@ class LimitedCache(OrderedDict):
         self.max_size = int(max_size) if max_size is not None else 0
 
     def __setitem__(self, key, value) -> None:
-        if key in self:
-            try:
-                self.move_to_end(key)
-            except Exception:
-                pass
         super().__setitem__(key, value)
+        self.move_to_end(key)
         if self.max_size > 0:
             while len(self) > self.max_size:
-                try:
-                    self.popitem(last=False)
-                except KeyError:
-                    break
+                self.popitem(last=False)
 
     def get(self, key, default=None):
-        if key in self:
-            try:
-                self.move_to_end(key)
-            except Exception:
-                pass
-        return super().get(key, default)
+        # 命中即提升为最近使用；单次 move_to_end 同时完成存在性判断，O(1)
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            return default
+        return super().__getitem__(key)
 
 
 @dataclass
@@ -2848,11 +2869,17 @@ def parse_object_token(token: str) -> Tuple[Optional[str], str]:
 
 
 def parse_object_from_filename(path: Path) -> Tuple[Optional[str], Optional[str]]:
-    stem = path.stem
+    return parse_object_from_stem(path.stem)
+
+
+# 同一文件名会在 fixup_scripts 与 done/ 的多轮扫描、索引构建中反复解析：按 stem 缓存并 intern 结果。
+# 缓存有上限，避免长时间运行时随脚本文件名无限增长；上限需覆盖单次扫描的脚本数，否则轮次间无法命中
+@lru_cache(maxsize=16384)
+def parse_object_from_stem(stem: str) -> Tuple[Optional[str], Optional[str]]:
     if "." not in stem:
         return None, None
     schema, name = stem.split(".", 1)
-    return normalize_identifier(schema), normalize_identifier(name)
+    return sys.intern(normalize_identifier(schema)), sys.intern(normalize_identifier(name))
 
 
 def parse_object_identity_from_path(path: Path) -> Tuple[Optional[str], Optional[str]]:
@@ -3210,7 +3237,8 @@ def parse_chain_node_meta(token: str) -> Optional[Tuple[str, str, Tuple[str, ...
     name = normalize_identifier(raw_name)
     if not name or not obj_type:
         return None
-    return name, obj_type, extra_meta
+    # 同一对象会出现在大量链路中：intern 后各链路节点共享同一字符串，字典/集合比较走指针快路径
+    return sys.intern(name), sys.intern(obj_type), extra_meta
 
 
 def parse_view_chain_line_meta(line: str) -> Optional[List[Tuple[str, str, Tuple[str, ...]]]]:
@@ -3243,17 +3271,17 @@ def parse_view_chain_line_meta(line: str) -> Optional[List[Tuple[str, str, Tuple
 def parse_view_chain_file_meta(
     path: Path,
 ) -> Dict[str, List[List[Tuple[str, str, Tuple[str, ...]]]]]:
+    chains_by_view: Dict[str, List[List[Tuple[str, str, Tuple[str, ...]]]]] = defaultdict(list)
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        with path.open("r", encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                nodes = parse_view_chain_line_meta(line)
+                if not nodes:
+                    continue
+                root = nodes[0][0]
+                chains_by_view[root].append(nodes)
     except OSError:
         return {}
-    chains_by_view: Dict[str, List[List[Tuple[str, str, Tuple[str, ...]]]]] = defaultdict(list)
-    for line in lines:
-        nodes = parse_view_chain_line_meta(line)
-        if not nodes:
-            continue
-        root = nodes[0][0]
-        chains_by_view[root].append(nodes)
     return dict(chains_by_view)
 
 
@@ -3284,7 +3312,7 @@ def parse_view_chain_line(line: str) -> Optional[List[Tuple[str, str]]]:
     return nodes
 
 
-def parse_view_chain_lines(lines: List[str]) -> Dict[str, List[List[Tuple[str, str]]]]:
+def parse_view_chain_lines(lines: Iterable[str]) -> Dict[str, List[List[Tuple[str, str]]]]:
     chains_by_view: Dict[str, List[List[Tuple[str, str]]]] = defaultdict(list)
     for line in lines:
         nodes = parse_view_chain_line(line)
@@ -3296,11 +3324,12 @@ def parse_view_chain_lines(lines: List[str]) -> Dict[str, List[List[Tuple[str, s
 
 
 def parse_view_chain_file(path: Path) -> Dict[str, List[List[Tuple[str, str]]]]:
+    # 直接把文件句柄逐行交给解析器，不先整体读入再切分
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        with path.open("r", encoding="utf-8", errors="replace") as fh:
+            return parse_view_chain_lines(fh)
     except OSError:
         return {}
-    return parse_view_chain_lines(lines)
 
 
 def object_type_to_dir(obj_type: str) -> Optional[str]:
@@ -3322,9 +3351,10 @@ def select_fixup_script_for_node(
         if candidates:
             dir_name = object_type_to_dir(obj_type)
             if dir_name:
-                typed = [p for p in candidates if p.parent.name.lower() == dir_name]
-                if typed:
-                    return typed[0]
+                # 只需第一个同类型目录下的脚本，命中即返回，不构造完整候选列表
+                for path in candidates:
+                    if path.parent.name.lower() == dir_name:
+                        return path
             return candidates[0]
         return None
     candidates = name_index.get(name, [])
@@ -3362,10 +3392,9 @@ def build_view_dependency_graph(
     nodes: Set[Tuple[str, str]] = set()
     edges: Dict[Tuple[str, str], Set[Tuple[str, str]]] = defaultdict(set)
     for chain in chains:
-        for idx, node in enumerate(chain):
-            nodes.add(node)
-            if idx + 1 < len(chain):
-                edges[node].add(chain[idx + 1])
+        nodes.update(chain)
+        for node, ref in zip(chain, chain[1:]):
+            edges[node].add(ref)
     return nodes, edges
 
 
@@ -3379,15 +3408,16 @@ def topo_sort_nodes(
         if node in visited:
             continue
         visiting: Set[Tuple[str, str]] = {node}
-        stack: List[Tuple[Tuple[str, str], Any, List[Tuple[str, str]]]] = [
-            (node, iter(sorted(edges.get(node, set()))), [node])
-        ]
+        # path 与 stack 同步入栈/出栈，避免每层复制一份完整路径（深链下为平方级开销）
+        path: List[Tuple[str, str]] = [node]
+        stack: List[Tuple[Tuple[str, str], Any]] = [(node, iter(sorted(edges.get(node, set()))))]
         while stack:
-            current, refs_iter, path = stack[-1]
+            current, refs_iter = stack[-1]
             try:
                 ref = next(refs_iter)
             except StopIteration:
                 stack.pop()
+                path.pop()
                 visiting.discard(current)
                 if current not in visited:
                     visited.add(current)
@@ -3402,7 +3432,8 @@ def topo_sort_nodes(
                 continue
 
             visiting.add(ref)
-            stack.append((ref, iter(sorted(edges.get(ref, set()))), path + [ref]))
+            path.append(ref)
+            stack.append((ref, iter(sorted(edges.get(ref, set())))))
     return order, cycles
 
 
@@ -3433,18 +3464,27 @@ def find_latest_report_file(report_dir: Path, prefix: str) -> Optional[Path]:
     candidates: List[Path] = []
     ts_re = re.compile(rf"{re.escape(prefix)}_(\d{{8}}_\d{{6}})")
     run_ts_re = re.compile(r"run_(\d{8}_\d{6})")
+    # 报告目录可能积累数百个 run_*：用 os.scandir 列目录（DirEntry 自带类型信息），只为命中项构造 Path
+    run_dirs: List[Tuple[str, str]] = []
     try:
-        run_dirs = [p for p in report_dir.glob("run_*") if p.is_dir()]
+        with os.scandir(report_dir) as it:
+            for entry in it:
+                if entry.name.startswith("run_") and entry.is_dir():
+                    match = run_ts_re.search(entry.name)
+                    run_dirs.append((match.group(1) if match else "", entry.path))
     except OSError:
         run_dirs = []
     # Prefer newest run directory if present.
-    run_dirs.sort(
-        key=lambda p: run_ts_re.search(p.name).group(1) if run_ts_re.search(p.name) else "",
-        reverse=True,
-    )
-    for run_dir in run_dirs:
+    run_dirs.sort(key=lambda item: item[0], reverse=True)
+    file_prefix = f"{prefix}_"
+    for _run_ts, run_dir_path in run_dirs:
         try:
-            run_candidates = list(run_dir.glob(f"{prefix}_*.txt"))
+            with os.scandir(run_dir_path) as it:
+                run_candidates = [
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.startswith(file_prefix) and entry.name.endswith(".txt")
+                ]
         except OSError:
             continue
         if run_candidates:
@@ -3481,41 +3521,42 @@ def find_latest_report_file(report_dir: Path, prefix: str) -> Optional[Path]:
         except OSError:
             return (0, "0")
 
-    candidates.sort(key=sort_key)
-    return candidates[-1]
+    # 只要最新的一个：单次 max 取代整表排序；reversed 保证同键时仍取排序后的最后一项
+    return max(reversed(candidates), key=sort_key)
 
 
 def parse_dependency_chains_file(path: Path) -> Dict[Tuple[str, str], Set[Tuple[str, str]]]:
     deps: Dict[Tuple[str, str], Set[Tuple[str, str]]] = defaultdict(set)
     if not path:
         return deps
+    section = ""
     try:
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        # 依赖链文件可能很大：逐行流式解析，不整体读入再切分
+        intern = sys.intern
+        with path.open("r", encoding="utf-8", errors="replace", buffering=1 << 20) as fh:
+            for raw in fh:
+                line = raw.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("["):
+                    section = "target" if line.upper().startswith("[TARGET") else "source"
+                    continue
+                if section != "target":
+                    continue
+                match = RE_DEPENDENCY_CHAIN_LINE.match(line)
+                if not match:
+                    continue
+                dep_full = normalize_full_name(match.group("dep"))
+                ref_full = normalize_full_name(match.group("ref"))
+                dep_type = normalize_object_type(match.group("dep_type"))
+                ref_type = normalize_object_type(match.group("ref_type"))
+                if not dep_full or not ref_full or not dep_type or not ref_type:
+                    continue
+                deps[(intern(dep_full), intern(dep_type))].add(
+                    (intern(ref_full), intern(ref_type))
+                )
     except OSError:
-        return deps
-    section = ""
-    line_re = re.compile(
-        r"^\s*(?:\d+\.)?\s*(?P<dep>[^()]+)\((?P<dep_type>[^)]+)\)\s*->\s*(?P<ref>[^()]+)\((?P<ref_type>[^)]+)\)"
-    )
-    for raw in lines:
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("["):
-            section = "target" if line.upper().startswith("[TARGET") else "source"
-            continue
-        if section != "target":
-            continue
-        match = line_re.match(line)
-        if not match:
-            continue
-        dep_full = normalize_full_name(match.group("dep"))
-        ref_full = normalize_full_name(match.group("ref"))
-        dep_type = normalize_object_type(match.group("dep_type"))
-        ref_type = normalize_object_type(match.group("ref_type"))
-        if not dep_full or not ref_full or not dep_type or not ref_type:
-            continue
-        deps[(dep_full, dep_type)].add((ref_full, ref_type))
+        deps.clear()
     return deps
 
 
@@ -3815,8 +3856,9 @@ def load_tab_privs_for_identity(
     tab_privs_cache: Dict[Tuple[str, str, str], Set[str]],
 ) -> Set[str]:
     key = (identity.upper(), owner.upper(), name.upper())
-    if key in tab_privs_cache:
-        return tab_privs_cache[key]
+    cached = tab_privs_cache.get(key)
+    if cached is not None:
+        return cached
     sql = (
         "SELECT PRIVILEGE FROM DBA_TAB_PRIVS "
         f"WHERE GRANTEE='{escape_sql_literal(identity.upper())}' "
@@ -3837,8 +3879,9 @@ def load_grantable_tab_privs_for_identity(
     tab_privs_grantable_cache: Dict[Tuple[str, str, str], Set[str]],
 ) -> Set[str]:
     key = (identity.upper(), owner.upper(), name.upper())
-    if key in tab_privs_grantable_cache:
-        return tab_privs_grantable_cache[key]
+    cached = tab_privs_grantable_cache.get(key)
+    if cached is not None:
+        return cached
     sql = (
         "SELECT PRIVILEGE FROM DBA_TAB_PRIVS "
         f"WHERE GRANTEE='{escape_sql_literal(identity.upper())}' "
@@ -4382,10 +4425,32 @@ def split_sql_statements(sql_text: str) -> List[str]:
             slash_block_end_name = ""
             continue
 
+        line_len = len(line)
         idx = 0
-        while idx < len(line):
+        while idx < line_len:
+            # 先整段吞入当前状态下的普通字符，只有可能改变状态的字符才逐个处理
+            if in_q_quote:
+                plain_end = line.find(q_quote_end, idx)
+                if plain_end < 0:
+                    plain_end = line_len
+            else:
+                if block_comment_depth > 0:
+                    plain_re = RE_SQL_SPLIT_PLAIN_IN_COMMENT
+                elif in_single:
+                    plain_re = RE_SQL_SPLIT_PLAIN_IN_SINGLE
+                elif in_double:
+                    plain_re = RE_SQL_SPLIT_PLAIN_IN_DOUBLE
+                else:
+                    plain_re = RE_SQL_SPLIT_PLAIN
+                plain_match = plain_re.match(line, idx)
+                plain_end = plain_match.end() if plain_match else idx
+            if plain_end > idx:
+                buffer.append(line[idx:plain_end])
+                idx = plain_end
+                continue
+
             ch = line[idx]
-            nxt = line[idx + 1] if idx + 1 < len(line) else ""
+            nxt = line[idx + 1] if idx + 1 < line_len else ""
 
             if block_comment_depth > 0:
                 buffer.append(ch)
@@ -4633,7 +4698,13 @@ def execute_sql_statements(
     current_schema: Optional[str] = None
 
     for idx, statement in enumerate(effective_statements, start=1):
-        match = CURRENT_SCHEMA_PATTERN.match(statement.strip())
+        stripped_statement = statement.strip()
+        # 绝大多数语句并非 ALTER：先做廉价的前缀判断，命中后再用完整正则提取 schema
+        match = (
+            CURRENT_SCHEMA_PATTERN.match(stripped_statement)
+            if stripped_statement[:5].upper() == "ALTER"
+            else None
+        )
         if match:
             current_schema = match.group("schema")
         statement_to_run = statement
@@ -5114,6 +5185,9 @@ def collect_sql_files_from_root(
 
 @dataclass(frozen=True)
 class GrantEntry:
+    # 授权脚本可达上万条：显式 __slots__ 省去每个实例的 __dict__（字段均无默认值，兼容 3.7）
+    __slots__ = ("grantee", "privileges", "object_name", "statement", "source_path", "grant_type")
+
     grantee: str
     privileges: Tuple[str, ...]
     object_name: Optional[str]
@@ -5121,12 +5195,46 @@ class GrantEntry:
     source_path: Path
     grant_type: str
 
+    # frozen + 手写 __slots__ 时默认的 copy/pickle 会走 setattr 而触发 FrozenInstanceError，
+    # 这里按槽位显式取值/回填（与 3.10+ dataclass(slots=True) 生成的实现一致）
+    def __getstate__(self) -> Tuple[object, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[object, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class GrantIndex:
-    by_grantee_object: Dict[Tuple[str, str], List[GrantEntry]]
-    by_object: Dict[str, List[GrantEntry]]
-    by_grantee_sys: Dict[str, List[GrantEntry]]
+    by_grantee_object: Dict[Tuple[str, str], Sequence[GrantEntry]]
+    by_object: Dict[str, Sequence[GrantEntry]]
+    by_grantee_sys: Dict[str, Sequence[GrantEntry]]
+    # (grantee, 对象名后缀) -> 授权条目；首次按对象名兜底匹配时由 by_grantee_object 惰性构建
+    by_grantee_name_suffix: Optional[Dict[Tuple[str, str], Sequence[GrantEntry]]] = None
+
+
+def freeze_grant_buckets(
+    buckets: Dict[Any, List[GrantEntry]],
+) -> Dict[Any, Tuple[GrantEntry, ...]]:
+    """索引构建完成后桶不再变化：转为 tuple，去掉 list 的预留空间。"""
+    return {key: tuple(entries) for key, entries in buckets.items()}
+
+
+def build_grant_name_suffix_index(
+    by_grantee_object: Dict[Tuple[str, str], Sequence[GrantEntry]],
+) -> Dict[Tuple[str, str], Tuple[GrantEntry, ...]]:
+    """
+    为每个 (grantee, OWNER.NAME) 按其每个 '.' 之后的后缀建立索引，
+    与 obj_key.endswith(f".{name}") 的匹配结果及顺序一致。
+    """
+    index: Dict[Tuple[str, str], List[GrantEntry]] = defaultdict(list)
+    for (grantee, obj_key), obj_entries in by_grantee_object.items():
+        pos = obj_key.find(".")
+        while pos >= 0:
+            index[(grantee, obj_key[pos + 1 :])].extend(obj_entries)
+            pos = obj_key.find(".", pos + 1)
+    return freeze_grant_buckets(index)
 
 
 def build_grant_index(
@@ -5136,7 +5244,7 @@ def build_grant_index(
     by_object: Dict[str, List[GrantEntry]] = defaultdict(list)
     by_grantee_sys: Dict[str, List[GrantEntry]] = defaultdict(list)
     if "grants" in exclude_dirs and "grants_miss" in exclude_dirs and "grants_all" in exclude_dirs:
-        return GrantIndex(dict(by_grantee_object), dict(by_object), dict(by_grantee_sys))
+        return GrantIndex({}, {}, {})
 
     subdirs = {
         p.name.lower(): p
@@ -5145,7 +5253,7 @@ def build_grant_index(
     }
     grant_dirs = resolve_grant_dirs(subdirs, include_dirs, exclude_dirs)
     if not grant_dirs:
-        return GrantIndex(dict(by_grantee_object), dict(by_object), dict(by_grantee_sys))
+        return GrantIndex({}, {}, {})
 
     for grant_dir in grant_dirs:
         grants_path = subdirs.get(grant_dir)
@@ -5162,12 +5270,14 @@ def build_grant_index(
                 if not parsed:
                     continue
                 grant_type, privs, object_full, grantees = parsed
+                # 同一语句的多个 grantee 共享同一份已裁剪的语句文本
+                statement_text = statement.strip()
                 for grantee in grantees:
                     entry = GrantEntry(
                         grantee=grantee,
                         privileges=privs,
                         object_name=object_full,
-                        statement=statement.strip(),
+                        statement=statement_text,
                         source_path=grant_file,
                         grant_type=grant_type,
                     )
@@ -5177,7 +5287,11 @@ def build_grant_index(
                     elif grant_type == "SYSTEM":
                         by_grantee_sys[grantee].append(entry)
 
-    return GrantIndex(dict(by_grantee_object), dict(by_object), dict(by_grantee_sys))
+    return GrantIndex(
+        freeze_grant_buckets(by_grantee_object),
+        freeze_grant_buckets(by_object),
+        freeze_grant_buckets(by_grantee_sys),
+    )
 
 
 def normalize_statement_key(statement: str) -> str:
@@ -5206,7 +5320,9 @@ def build_auto_grant_statement(
 def split_grant_list(raw: str) -> List[str]:
     if not raw:
         return []
-    return [item.strip().upper() for item in raw.split(",") if item.strip()]
+    # 权限名取值很少却在上万条授权里重复出现：驻留后各 GrantEntry 共享同一字符串对象
+    intern = sys.intern
+    return [intern(item.strip().upper()) for item in raw.split(",") if item.strip()]
 
 
 def split_grantee_list(raw: str) -> List[str]:
@@ -5296,26 +5412,24 @@ def select_grant_entries(
     schema: Optional[str],
     name: str,
     view_schema: Optional[str],
-) -> List[GrantEntry]:
-    entries: List[GrantEntry] = []
+) -> Sequence[GrantEntry]:
+    entries: Sequence[GrantEntry] = ()
     if schema:
         key = f"{schema}.{name}"
-        entries = grant_index.by_grantee_object.get((grantee, key), [])
+        entries = grant_index.by_grantee_object.get((grantee, key), ())
         if entries:
             return entries
     if view_schema:
         key = f"{view_schema}.{name}"
-        entries = grant_index.by_grantee_object.get((grantee, key), [])
+        entries = grant_index.by_grantee_object.get((grantee, key), ())
         if entries:
             return entries
-    suffix = f".{name}"
-    candidates: List[GrantEntry] = []
-    for (entry_grantee, obj_key), obj_entries in grant_index.by_grantee_object.items():
-        if entry_grantee != grantee:
-            continue
-        if obj_key.endswith(suffix):
-            candidates.extend(obj_entries)
-    return candidates
+    # 按对象名兜底：查后缀索引，避免每次未命中都全量扫描 by_grantee_object
+    if grant_index.by_grantee_name_suffix is None:
+        grant_index.by_grantee_name_suffix = build_grant_name_suffix_index(
+            grant_index.by_grantee_object
+        )
+    return grant_index.by_grantee_name_suffix.get((grantee, name), ())
 
 
 def select_object_grant_entries_for_priv(
@@ -5346,11 +5460,8 @@ def select_system_grant_entries_for_priv(
     if not entries:
         return []
     implied_upper = {p.upper() for p in implied}
-    return [
-        entry
-        for entry in entries
-        if any(priv.upper() in implied_upper for priv in entry.privileges)
-    ]
+    # entry.privileges 在 split_grant_list 中已统一大写
+    return [entry for entry in entries if not implied_upper.isdisjoint(entry.privileges)]
 
 
 def find_grant_entries_by_priority(
@@ -5868,13 +5979,11 @@ def build_compile_statement(owner: str, obj_name: str, obj_type: str) -> Optiona
     if not owner or not obj_name or not obj_type:
         return None
     obj_type_u = obj_type.strip().upper()
-    qualified = quote_qualified_name(owner, obj_name)
-    if obj_type_u in {"VIEW", "MATERIALIZED VIEW", "TYPE BODY"}:
-        return None
+    # 先按类型判定，不支持的类型无需再拼接带引号的对象名
     if obj_type_u == "PACKAGE BODY":
-        return f"ALTER PACKAGE {qualified} COMPILE BODY;"
+        return f"ALTER PACKAGE {quote_qualified_name(owner, obj_name)} COMPILE BODY;"
     if obj_type_u in {"PACKAGE", "TYPE", "PROCEDURE", "FUNCTION", "TRIGGER"}:
-        return f"ALTER {obj_type_u} {qualified} COMPILE;"
+        return f"ALTER {obj_type_u} {quote_qualified_name(owner, obj_name)} COMPILE;"
     return None
 
 
@@ -5970,6 +6079,8 @@ def recompile_invalid_objects(
 
 
 def parse_args() -> argparse.Namespace:
+    import argparse
+
     desc = textwrap.dedent(
         """\
         增强版修补脚本执行器 - 支持依赖感知排序和自动重编译
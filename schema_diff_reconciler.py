@@ -11008,9 +11008,10 @@ def parse_trigger_list_file(
     try:
         with path.open("r", encoding="utf-8", errors="replace") as fp:
             for line_no, raw in enumerate(fp, start=1):
-                line = raw.strip()
-                if not line or line.startswith("#"):
+                stripped = raw.strip()
+                if not stripped or stripped.startswith("#"):
                     continue
+                line = stripped
                 if "#" in line:
                     line = line.split("#", 1)[0].strip()
                     if not line:
@@ -11018,14 +11019,14 @@ def parse_trigger_list_file(
                 total_lines += 1
                 if "." not in line:
                     invalid_entries.append(
-                        (line_no, raw.strip(), "缺少 schema 前缀 (SCHEMA.TRIGGER_NAME)")
+                        (line_no, stripped, "缺少 schema 前缀 (SCHEMA.TRIGGER_NAME)")
                     )
                     continue
                 schema, name = line.split(".", 1)
                 schema = schema.strip().strip('"')
                 name = name.strip().strip('"')
                 if not schema or not name:
-                    invalid_entries.append((line_no, raw.strip(), "schema 或 trigger 名称为空"))
+                    invalid_entries.append((line_no, stripped, "schema 或 trigger 名称为空"))
                     continue
                 full_name = f"{schema.upper()}.{name.upper()}"
                 if full_name in entries:
@@ -21955,33 +21956,33 @@ def compute_object_counts(
     基于“期望对象集合”统计各类型的：源端数量、目标端命中数量、缺失数量、额外数量。
     目标端数量仅统计“期望对象”的命中数，避免“缺 1 张表 + 额外 1 张表”被误判为数量一致。
     """
-    expected_by_type: Dict[str, Set[str]] = {t.upper(): set() for t in monitored_types}
-    for _src, type_map in full_object_mapping.items():
-        for obj_type, tgt_name in type_map.items():
-            obj_type_u = obj_type.upper()
-            if obj_type_u not in expected_by_type:
-                continue
-            expected_by_type[obj_type_u].add(tgt_name.upper())
-
+    # CONSTRAINT/INDEX 只按元数据条数粗略计数，无需构建名称集合
+    count_only_types = ("CONSTRAINT", "INDEX")
+    expected_by_type: Dict[str, Set[str]] = {
+        t.upper(): set() for t in monitored_types if t.upper() not in count_only_types
+    }
     invalid_targets_by_type: Dict[str, Set[str]] = defaultdict(set)
+    # 单次遍历映射：同时收集期望目标集合与源端 INVALID 的 PACKAGE/PACKAGE BODY 目标
     for src_full, type_map in full_object_mapping.items():
-        if "." not in src_full:
-            continue
-        src_schema, src_obj = src_full.split(".", 1)
-        src_schema_u = src_schema.upper()
-        src_obj_u = src_obj.upper()
-        for obj_type in PACKAGE_OBJECT_TYPES:
-            tgt_name = type_map.get(obj_type)
-            if not tgt_name:
+        src_key: Optional[Tuple[str, str]] = None
+        for obj_type, tgt_name in type_map.items():
+            obj_type_u = obj_type.upper()
+            expected_targets = expected_by_type.get(obj_type_u)
+            if expected_targets is not None:
+                expected_targets.add(tgt_name.upper())
+            if obj_type not in PACKAGE_OBJECT_TYPES or not tgt_name or "." not in src_full:
                 continue
-            status = oracle_meta.object_statuses.get((src_schema_u, src_obj_u, obj_type))
+            if src_key is None:
+                src_schema, src_obj = src_full.split(".", 1)
+                src_key = (src_schema.upper(), src_obj.upper())
+            status = oracle_meta.object_statuses.get((src_key[0], src_key[1], obj_type))
             if normalize_object_status(status) == "INVALID":
                 invalid_targets_by_type[obj_type].add(tgt_name.upper())
 
     actual_by_type: Dict[str, Set[str]] = {
         t.upper(): {name.upper() for name in ob_meta.objects_by_type.get(t.upper(), set())}
         for t in monitored_types
-        if t != "CONSTRAINT"
+        if t.upper() not in count_only_types and t.upper() != "CONTEXT"
     }
     managed_target_object_set = (
         build_managed_target_object_set(full_object_mapping)
@@ -21995,40 +21996,11 @@ def compute_object_counts(
     for obj_type in monitored_types:
         obj_type_u = obj_type.upper()
 
-        if obj_type_u == "CONSTRAINT":
-            # Constraints are not in DBA_OBJECTS, so they need special handling
-            expected_set = {
-                cons_name for cons_map in oracle_meta.constraints.values() for cons_name in cons_map
-            }
-            actual_set = {
-                cons_name for cons_map in ob_meta.constraints.values() for cons_name in cons_map
-            }
-        elif obj_type_u == "CONTEXT":
-            expected_set = {
-                normalize_identifier_name(name)
-                for name in (oracle_meta.contexts or {}).keys()
-                if normalize_identifier_name(name)
-            }
-            actual_set = {
-                normalize_identifier_name(name)
-                for name in (ob_meta.contexts or {}).keys()
-                if normalize_identifier_name(name)
-            }
-        else:
-            expected_set = expected_by_type.get(obj_type_u, set())
-            actual_set = actual_by_type.get(obj_type_u, set())
-            ignored_due_source_invalid = invalid_targets_by_type.get(obj_type_u, set())
-            if ignored_due_source_invalid:
-                # 源端 INVALID 的 PACKAGE/PACKAGE BODY 不参与“缺失/多余”数量统计：
-                # 需同时从 expected 和 actual 移除，避免被误计为 extra。
-                expected_set = expected_set - ignored_due_source_invalid
-                actual_set = actual_set - ignored_due_source_invalid
-
         # For constraints and indexes, names can be system-generated. A simple name comparison is not enough.
         # This count is a rough estimation. Final report counts are reconciled later from semantic mismatch details
         # (see reconcile_object_counts_summary), so we avoid raising early "issue_types" noise from this stage.
         # Here we count based on what's found in meta, not remapped names, for simplicity.
-        if obj_type_u in ("CONSTRAINT", "INDEX"):
+        if obj_type_u in count_only_types:
             if obj_type_u == "CONSTRAINT":
 
                 def _count_pkukfk(cons_maps: Dict[Tuple[str, str], Dict[str, Dict]]) -> int:
@@ -22053,6 +22025,27 @@ def compute_object_counts(
             # NOTE: do not add INDEX/CONSTRAINT to early issue_types warning list.
             continue
 
+        if obj_type_u == "CONTEXT":
+            expected_set = {
+                normalize_identifier_name(name)
+                for name in (oracle_meta.contexts or {}).keys()
+                if normalize_identifier_name(name)
+            }
+            actual_set = {
+                normalize_identifier_name(name)
+                for name in (ob_meta.contexts or {}).keys()
+                if normalize_identifier_name(name)
+            }
+        else:
+            expected_set = expected_by_type.get(obj_type_u, set())
+            actual_set = actual_by_type.get(obj_type_u, set())
+            ignored_due_source_invalid = invalid_targets_by_type.get(obj_type_u, set())
+            if ignored_due_source_invalid:
+                # 源端 INVALID 的 PACKAGE/PACKAGE BODY 不参与“缺失/多余”数量统计：
+                # 需同时从 expected 和 actual 移除，避免被误计为 extra。
+                expected_set = expected_set - ignored_due_source_invalid
+                actual_set = actual_set - ignored_due_source_invalid
+
         matched = expected_set & actual_set
         missing_set = expected_set - actual_set
         extra_set = actual_set - expected_set
@@ -28488,6 +28481,9 @@ def load_ob_dependencies(
 
     result: Set[Tuple[str, str, str, str]] = set()
     if lines:
+        # 同一对象名/类型会在大量依赖行中重复出现，intern 后共享同一字符串对象，
+        # 降低大依赖集的内存占用，后续集合比较也可走指针相等的快路径。
+        intern = sys.intern
         for line in lines:
             parts = line.split("\t")
             if len(parts) < 6:
@@ -28500,7 +28496,14 @@ def load_ob_dependencies(
             ref_type = parts[5].strip().upper()
             if not owner or not name or not ref_owner or not ref_name:
                 continue
-            result.add((f"{owner}.{name}", obj_type, f"{ref_owner}.{ref_name}", ref_type))
+            result.add(
+                (
+                    intern(f"{owner}.{name}"),
+                    intern(obj_type),
+                    intern(f"{ref_owner}.{ref_name}"),
+                    intern(ref_type),
+                )
+            )
 
     log.info("OceanBase 依赖信息加载完成，共 %d 条记录。", len(result))
     return result
@@ -28746,30 +28749,31 @@ def export_dependency_chains(
             ),
         )
 
+    lines: List[str] = [
+        "# 依赖链下探（终点为 TABLE/MVIEW 或无进一步依赖）",
+        f"# 目标端依赖数: {len(expected_pairs)}, 源端依赖数: {len(source_pairs)}",
+        "",
+    ]
+    if source_chains:
+        lines.append("[SOURCE - ORACLE] 依赖链:")
+        lines.extend(f"{idx:05d}. {line}" for idx, line in enumerate(source_chains, 1))
+        if source_cycles:
+            lines.append("")
+            lines.append("[SOURCE] 检测到依赖环:")
+            lines.extend(f"- {cyc}" for cyc in source_cycles)
+        lines.append("")
+    lines.append("[TARGET - REMAPPED] 依赖链:")
+    lines.extend(f"{idx:05d}. {line}" for idx, line in enumerate(target_chains, 1))
+    if target_cycles:
+        lines.append("")
+        lines.append("[TARGET] 检测到依赖环:")
+        lines.extend(f"- {cyc}" for cyc in target_cycles)
+    lines.append("")
+
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as f:
-            f.write("# 依赖链下探（终点为 TABLE/MVIEW 或无进一步依赖）\n")
-            f.write(f"# 目标端依赖数: {len(expected_pairs)}, 源端依赖数: {len(source_pairs)}\n\n")
-
-            if source_chains:
-                f.write("[SOURCE - ORACLE] 依赖链:\n")
-                for idx, line in enumerate(source_chains, 1):
-                    f.write(f"{idx:05d}. {line}\n")
-                if source_cycles:
-                    f.write("\n[SOURCE] 检测到依赖环:\n")
-                    for cyc in source_cycles:
-                        f.write(f"- {cyc}\n")
-                f.write("\n")
-
-            f.write("[TARGET - REMAPPED] 依赖链:\n")
-            for idx, line in enumerate(target_chains, 1):
-                f.write(f"{idx:05d}. {line}\n")
-            if target_cycles:
-                f.write("\n[TARGET] 检测到依赖环:\n")
-                for cyc in target_cycles:
-                    f.write(f"- {cyc}\n")
-            f.write("\n")
+        # 整体拼接后一次写入，避免大链路文件逐行 write
+        output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
     except OSError as exc:
         log.warning("写入依赖链文件失败: %s", exc)
         return None
@@ -29056,20 +29060,21 @@ def export_view_fixup_chains(
     if not chains:
         return None
 
+    lines: List[str] = [
+        "# VIEW fixup dependency chains",
+        "# 格式: OWNER.OBJ[TYPE|EXISTS|GRANT_STATUS]",
+        f"# views={len(set(view_targets))}, chains={len(chains)}, cycles={len(cycles)}",
+        "",
+    ]
+    lines.extend(f"{idx:05d}. {line}" for idx, line in enumerate(chains, 1))
+    if cycles:
+        lines.append("")
+        lines.append("[CYCLES]")
+        lines.extend(f"- {cyc}" for cyc in cycles)
+
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as f:
-            f.write("# VIEW fixup dependency chains\n")
-            f.write("# 格式: OWNER.OBJ[TYPE|EXISTS|GRANT_STATUS]\n")
-            f.write(
-                f"# views={len(set(view_targets))}, chains={len(chains)}, cycles={len(cycles)}\n\n"
-            )
-            for idx, line in enumerate(chains, 1):
-                f.write(f"{idx:05d}. {line}\n")
-            if cycles:
-                f.write("\n[CYCLES]\n")
-                for cyc in cycles:
-                    f.write(f"- {cyc}\n")
+        output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
         return output_path
     except OSError as exc:
         log.warning("写入 VIEWs_chain 文件失败: %s", exc)
@@ -44730,26 +44735,28 @@ def write_fixup_file(
     target_dir = base_dir / subdir
     ensure_dir(target_dir)
     file_path = target_dir / filename
+    # 先在内存中拼好整个文件再一次写出，避免大批量小文件逐段 write
+    parts: List[str] = [
+        f"-- {header_comment}\n",
+        "-- 本文件由校验工具自动生成，请在 OceanBase 执行前仔细审核。\n\n",
+    ]
+    if extra_comments:
+        parts.extend(f"-- {line}\n" for line in extra_comments if line)
+        parts.append("\n")
+
+    body = content.strip()
+    parts.append(body)
+    parts.append("\n")
+    tail = body.rstrip()
+    if tail and not tail.endswith((";", "/")):
+        parts.append(";\n")
+
+    if grants_to_add:
+        parts.append("\n-- 自动追加相关授权语句\n")
+        parts.extend(f"{grant_stmt}\n" for grant_stmt in sorted(grants_to_add))
+
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(f"-- {header_comment}\n")
-        f.write("-- 本文件由校验工具自动生成，请在 OceanBase 执行前仔细审核。\n\n")
-        if extra_comments:
-            for line in extra_comments:
-                if line:
-                    f.write(f"-- {line}\n")
-            f.write("\n")
-
-        body = content.strip()
-        f.write(body)
-        f.write("\n")
-        tail = body.rstrip()
-        if tail and not tail.endswith((";", "/")):
-            f.write(";\n")
-
-        if grants_to_add:
-            f.write("\n-- 自动追加相关授权语句\n")
-            for grant_stmt in sorted(grants_to_add):
-                f.write(f"{grant_stmt}\n")
+        f.write("".join(parts))
 
     log.info(f"[FIXUP] 生成目标端订正 SQL: {file_path}")
     return file_path
@@ -52279,19 +52286,53 @@ def export_full_object_mapping(
         return None
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        lines: List[str] = []
-        for src_full in sorted(full_object_mapping.keys()):
-            type_map = full_object_mapping.get(src_full, {})
-            for obj_type in sorted(type_map.keys()):
-                tgt_full = type_map[obj_type]
-                lines.append(f"{src_full}\t{obj_type}\t{tgt_full}")
-        output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # 映射可达十万级条目：逐行生成交给大缓冲区批量落盘，不再同时持有行列表和拼接后的整串
+        with output_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(
+                f"{src_full}\t{obj_type}\t{type_map[obj_type]}\n"
+                for src_full, type_map in sorted(full_object_mapping.items())
+                for obj_type in sorted(type_map)
+            )
         return output_path
     except OSError as exc:
         log.warning("写入对象映射文件失败 %s: %s", output_path, exc)
         return None
 
 
+def export_object_mapping_artifacts(
+    full_object_mapping: FullObjectMapping,
+    discovery_full_object_mapping: Optional[FullObjectMapping],
+    mapping_path: Path,
+    discovery_mapping_output_path: Path,
+    include_managed_mapping: bool = True,
+) -> Tuple[Optional[Path], List[str]]:
+    """
+    输出受管对象映射与 discovery-only 映射，返回 (discovery-only 映射文件, 映射范围诊断)。
+    include_managed_mapping=False 时（主校验清单为空）只跳过受管映射文件。
+    """
+    if include_managed_mapping:
+        mapping_written = export_full_object_mapping(full_object_mapping, mapping_path)
+        if mapping_written:
+            log.info("受管对象映射已输出: %s", mapping_written)
+    discovery_only_mapping = build_discovery_only_object_mapping(
+        discovery_full_object_mapping,
+        full_object_mapping,
+    )
+    discovery_mapping_path = (
+        export_full_object_mapping(discovery_only_mapping, discovery_mapping_output_path)
+        if discovery_only_mapping
+        else None
+    )
+    if discovery_mapping_path:
+        log.info("discovery-only 对象映射已输出: %s", discovery_mapping_path)
+    diagnostics = build_mapping_scope_diagnostics(
+        discovery_full_object_mapping,
+        full_object_mapping,
+        discovery_mapping_path,
+    )
+    return discovery_mapping_path, diagnostics
+
+
 def export_remap_conflicts(remap_conflicts: RemapConflictMap, output_path: Path) -> Optional[Path]:
     """
     输出无法自动推导的对象列表，便于提醒显式 remap。
@@ -67071,6 +67112,17 @@ def main():
             str(settings.get("table_data_presence_check_mode", "auto")).strip().lower()
         )
         enable_table_presence_check: bool = table_data_presence_mode != "off"
+        # 以下设置在运行期间不可热加载，入口处读取一次后复用
+        enable_schema_mapping_infer: bool = bool(settings.get("enable_schema_mapping_infer", True))
+        print_dependency_chains: bool = bool(settings.get("print_dependency_chains", True))
+        trigger_list_path: str = str(settings.get("trigger_list") or "").strip()
+        report_dir_setting: str = (
+            str(settings.get("report_dir") or "main_reports").strip() or "main_reports"
+        )
+        fixup_dir_label: str = settings.get("fixup_dir", "fixup_scripts") or "fixup_scripts"
+        progress_log_interval: float = parse_float_setting(
+            settings.get("progress_log_interval", 10), 10.0, minimum=1.0
+        )
 
         if source_capabilities.get("requires_oracle_client", False):
             init_oracle_client_from_settings(settings)
@@ -67394,7 +67446,7 @@ def main():
             scope_discovery_types - NO_INFER_SCHEMA_TYPES - {"TABLE", "INDEX", "CONSTRAINT"}
         )
         need_dependency_infer = enable_dependencies_check or (
-            bool(settings.get("enable_schema_mapping_infer", True)) and bool(infer_candidate_types)
+            enable_schema_mapping_infer and bool(infer_candidate_types)
         )
         need_grant_dependencies = enable_grant_generation and generate_fixup_enabled
         need_dependency_load = (
@@ -67562,9 +67614,8 @@ def main():
             settings.get("source_object_scope_mode", "full_source")
         )
         if is_scoped_source_mode(source_scope_mode):
-            trigger_list_path_scoped = settings.get("trigger_list", "").strip()
             trigger_entries_scoped: Set[str] = set()
-            if trigger_list_path_scoped:
+            if trigger_list_path:
                 if "TRIGGER" not in enabled_extra_types:
                     log.error(
                         "严重错误: source_object_scope_mode=%s 且已配置 trigger_list，但 check_extra_types 未启用 TRIGGER。",
@@ -67572,7 +67623,7 @@ def main():
                     )
                     abort_run()
                 entries, invalid_entries, duplicate_entries, _total_lines, read_error = (
-                    parse_trigger_list_file(trigger_list_path_scoped)
+                    parse_trigger_list_file(trigger_list_path)
                 )
                 if read_error:
                     log.error(
@@ -67800,7 +67851,7 @@ def main():
                     view_dependency_map.setdefault(key, set()).update(refs)
         # 4.2.b) 预计算递归依赖表集合（性能优化：避免每对象 DFS）
         transitive_table_cache: Optional[TransitiveTableCache] = None
-        if settings.get("enable_schema_mapping_infer") and dependency_graph:
+        if enable_schema_mapping_infer and dependency_graph:
             log.info("正在预计算依赖图的递归 TABLE/MVIEW 引用缓存以加速 remap 推导...")
             transitive_table_cache = precompute_transitive_table_cache(
                 dependency_graph, object_parent_map=object_parent_map
@@ -67837,7 +67888,7 @@ def main():
             remap_conflicts=remap_conflicts,
             sequence_remap_policy=sequence_policy,
         )
-        if settings.get("enable_schema_mapping_infer"):
+        if enable_schema_mapping_infer:
             schema_mapping_from_tables = build_schema_mapping(base_master_list)
         schema_mapping_for_grants = derive_schema_mapping_from_rules(schema_mapping_remap_rules)
         if schema_mapping_from_tables:
@@ -67885,7 +67936,6 @@ def main():
         target_schemas: Set[str] = set(managed_target_scope.target_schemas)
         target_table_pairs = collect_table_pairs(master_list, use_target=True)
 
-    report_dir_setting = settings.get("report_dir", "main_reports").strip() or "main_reports"
     report_layout = settings.get("report_dir_layout", "per_run")
     report_root = Path(report_dir_setting)
     report_dir = report_root / f"run_{timestamp}" if report_layout == "per_run" else report_root
@@ -68040,28 +68090,15 @@ def main():
     gtt_transform_detail_path: Optional[Path] = None
 
     # 输出受管对象映射；若 closure discovery 更宽，则另存 discovery-only 映射供审计。
+    # 主校验清单为空时跳过受管映射导出，但 discovery-only 映射与范围诊断照常输出，
+    # 以便在空报告中解释“清单为空”的原因。
     mapping_path = report_dir / f"object_mapping_{timestamp}.txt"
-    mapping_written = export_full_object_mapping(full_object_mapping, mapping_path)
-    if mapping_written:
-        log.info("受管对象映射已输出: %s", mapping_written)
-    discovery_only_mapping = build_discovery_only_object_mapping(
-        discovery_full_object_mapping,
+    discovery_mapping_path, mapping_scope_diagnostics = export_object_mapping_artifacts(
         full_object_mapping,
-    )
-    discovery_mapping_path = (
-        export_full_object_mapping(
-            discovery_only_mapping,
-            report_dir / f"object_mapping_discovery_{timestamp}.txt",
-        )
-        if discovery_only_mapping
-        else None
-    )
-    if discovery_mapping_path:
-        log.info("discovery-only 对象映射已输出: %s", discovery_mapping_path)
-    mapping_scope_diagnostics = build_mapping_scope_diagnostics(
         discovery_full_object_mapping,
-        full_object_mapping,
-        discovery_mapping_path,
+        mapping_path,
+        report_dir / f"object_mapping_discovery_{timestamp}.txt",
+        include_managed_mapping=bool(master_list),
     )
     if mapping_scope_diagnostics:
         if config_diagnostics is None:
@@ -68169,7 +68206,6 @@ def main():
                 config_diagnostics.append(f"配置热加载明细: {hot_reload_events_file}")
         report_start_perf = time.perf_counter()
         trigger_summary_stub = None
-        trigger_list_path = settings.get("trigger_list", "").strip()
         if trigger_list_path:
             trigger_summary_stub = {
                 "enabled": True,
@@ -68196,9 +68232,9 @@ def main():
             enable_dependencies_check=enable_dependencies_check,
             enable_comment_check=enable_comment_check,
             enable_grant_generation=enable_grant_generation,
-            enable_schema_mapping_infer=settings.get("enable_schema_mapping_infer", True),
+            enable_schema_mapping_infer=enable_schema_mapping_infer,
             fixup_enabled=generate_fixup_enabled,
-            fixup_dir=settings.get("fixup_dir", "fixup_scripts") or "fixup_scripts",
+            fixup_dir=fixup_dir_label,
             dependency_chain_file=None,
             view_chain_file=None,
             trigger_list_summary=trigger_summary_stub,
@@ -68614,7 +68650,7 @@ def main():
             view_callable_dep_map = (
                 filter_view_dependency_map_by_nodes(view_callable_dep_map, excluded_nodes) or {}
             )
-            if settings.get("enable_schema_mapping_infer") and dependency_graph:
+            if enable_schema_mapping_infer and dependency_graph:
                 transitive_table_cache = precompute_transitive_table_cache(
                     dependency_graph, object_parent_map=object_parent_map
                 )
@@ -68986,10 +69022,10 @@ def main():
         config_diagnostics.extend(refreshed_scope_diagnostics)
 
     log_section("差异校验")
+    # OBJECT_COUNT_TYPES 已为大写，合并一次后直接做成员判断
+    counted_types = checked_primary_types | enabled_extra_types
     monitored_types: Tuple[str, ...] = tuple(
-        t
-        for t in OBJECT_COUNT_TYPES
-        if (t.upper() in checked_primary_types) or (t.upper() in enabled_extra_types)
+        t for t in OBJECT_COUNT_TYPES if t in counted_types
     ) or ("TABLE",)
 
     apply_config_hot_reload_at_phase(hot_reload_runtime, "主对象校验", settings, ora_cfg, ob_cfg)
@@ -69230,7 +69266,6 @@ def main():
     trigger_list_rows: Optional[List[TriggerListReportRow]] = None
     trigger_filter_entries: Optional[Set[str]] = None
     trigger_filter_enabled = False
-    trigger_list_path = settings.get("trigger_list", "").strip()
     if trigger_list_path:
         entries, invalid_entries, duplicate_entries, total_lines, read_error = (
             parse_trigger_list_file(trigger_list_path)
@@ -69326,7 +69361,7 @@ def main():
                 len(dependency_report.get("unexpected", [])),
                 len(dependency_report.get("skipped", [])),
             )
-            if settings.get("print_dependency_chains", True):
+            if print_dependency_chains:
                 dep_chain_path = report_dir / f"dependency_chains_{timestamp}.txt"
                 expected_pair_count = len(expected_dependency_pairs or set())
                 source_record_count = len(oracle_dependencies_internal or [])
@@ -69397,7 +69432,6 @@ def main():
     fixup_skip_summary: Dict[str, Dict[str, object]] = {}
     unsupported_grant_target_extra_rows: Dict[str, ObjectSupportReportRow] = {}
     if generate_fixup_enabled:
-        fixup_dir_label = settings.get("fixup_dir", "fixup_scripts") or "fixup_scripts"
         log.info("已开启修补脚本生成，开始写入 %s 目录...", fixup_dir_label)
         apply_config_hot_reload_at_phase(
             hot_reload_runtime, "修补脚本生成", settings, ora_cfg, ob_cfg
@@ -69405,11 +69439,6 @@ def main():
         with phase_timer("修补脚本生成", phase_durations):
             grant_plan = None
             if enable_grant_generation:
-                try:
-                    grant_progress_interval = float(settings.get("progress_log_interval", 10))
-                except (TypeError, ValueError):
-                    grant_progress_interval = 10.0
-                grant_progress_interval = max(1.0, grant_progress_interval)
                 supported_sys_privs = settings.get("grant_supported_sys_privs_set", set())
                 supported_object_privs = settings.get("grant_supported_object_privs_set", set())
                 include_oracle_maintained_roles = bool(
@@ -69502,7 +69531,7 @@ def main():
                     ob_users=ob_users,
                     include_oracle_maintained_roles=include_oracle_maintained_roles,
                     dependencies=oracle_dependencies_for_grants,
-                    progress_interval=grant_progress_interval,
+                    progress_interval=progress_log_interval,
                     sequence_remap_policy=sequence_policy,
                     grant_generation_mode=settings.get("grant_generation_mode", "full"),
                 )
@@ -69736,9 +69765,9 @@ def main():
         enable_dependencies_check=enable_dependencies_check,
         enable_comment_check=enable_comment_check,
         enable_grant_generation=enable_grant_generation,
-        enable_schema_mapping_infer=settings.get("enable_schema_mapping_infer", True),
+        enable_schema_mapping_infer=enable_schema_mapping_infer,
         fixup_enabled=generate_fixup_enabled,
-        fixup_dir=settings.get("fixup_dir", "fixup_scripts") or "fixup_scripts",
+        fixup_dir=fixup_dir_label,
         dependency_chain_file=dependency_chain_file,
         view_chain_file=view_chain_file,
         trigger_list_summary=trigger_list_summary,
@@ -0,0 +1,217 @@
+import copy
+import pickle
+import subprocess
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import run_fixup as rf
+
+
+class SplitSqlStatementsTests(unittest.TestCase):
+    def test_splits_plain_statements(self):
+        self.assertEqual(
+            rf.split_sql_statements("SELECT 1 FROM DUAL;\nSELECT 2 FROM DUAL;\n"),
+            ["SELECT 1 FROM DUAL;", "SELECT 2 FROM DUAL;"],
+        )
+
+    def test_semicolons_inside_quotes_do_not_split(self):
+        self.assertEqual(
+            rf.split_sql_statements(
+                "INSERT INTO T VALUES ('a;b', 'it''s;');\n"
+                'CREATE TABLE "A;B" ("C""D" NUMBER);\n'
+                "COMMIT;"
+            ),
+            [
+                "INSERT INTO T VALUES ('a;b', 'it''s;');",
+                'CREATE TABLE "A;B" ("C""D" NUMBER);',
+                "COMMIT;",
+            ],
+        )
+
+    def test_string_literal_spanning_lines_keeps_comment_markers(self):
+        self.assertEqual(
+            rf.split_sql_statements(
+                "INSERT INTO T VALUES ('line1;\n-- not comment;\nline3');\nCOMMIT;"
+            ),
+            ["INSERT INTO T VALUES ('line1;\n-- not comment;\nline3');", "COMMIT;"],
+        )
+
+    def test_q_quote_literals(self):
+        self.assertEqual(
+            rf.split_sql_statements(
+                "INSERT INTO T VALUES (q'[x;']y]');\n"
+                "INSERT INTO T VALUES (Q'{a;}');\n"
+                "INSERT INTO T VALUES (q'#a;\n/\nb;#');\n"
+                "COMMIT;"
+            ),
+            [
+                "INSERT INTO T VALUES (q'[x;']y]');",
+                "INSERT INTO T VALUES (Q'{a;}');",
+                "INSERT INTO T VALUES (q'#a;\n/\nb;#');",
+                "COMMIT;",
+            ],
+        )
+
+    def test_comments(self):
+        self.assertEqual(
+            rf.split_sql_statements(
+                "-- a; b\n"
+                "SELECT 1 FROM DUAL; /* c; d */\n"
+                "SELECT 2 /* x /* y; */ z; */ FROM DUAL;\n"
+                "/* multi;\nline; */ SELECT 3 FROM DUAL;\n"
+            ),
+            [
+                "-- a; b\nSELECT 1 FROM DUAL;",
+                "/* c; d */\nSELECT 2 /* x /* y; */ z; */ FROM DUAL;",
+                "/* multi;\nline; */ SELECT 3 FROM DUAL;",
+            ],
+        )
+
+    def test_operator_characters_outside_literals(self):
+        self.assertEqual(
+            rf.split_sql_statements("SELECT 5-3, 6/3, SEQ FROM DUAL;\nSELECT q1 FROM T;"),
+            ["SELECT 5-3, 6/3, SEQ FROM DUAL;", "SELECT q1 FROM T;"],
+        )
+
+    def test_plsql_blocks_terminated_by_slash(self):
+        self.assertEqual(
+            rf.split_sql_statements(
+                "CREATE OR REPLACE PROCEDURE P AS\n"
+                "BEGIN\n"
+                "  NULL;\n"
+                "  INSERT INTO T VALUES ('x;');\n"
+                "END;\n"
+                "/\n"
+                "BEGIN\n"
+                "  NULL;\n"
+                "END;\n"
+                "/\n"
+                "SELECT 1 FROM DUAL;\n"
+            ),
+            [
+                "CREATE OR REPLACE PROCEDURE P AS\n"
+                "BEGIN\n"
+                "  NULL;\n"
+                "  INSERT INTO T VALUES ('x;');\n"
+                "END;",
+                "BEGIN\n  NULL;\nEND;",
+                "SELECT 1 FROM DUAL;",
+            ],
+        )
+
+
+def _grant_entry(grantee, object_name, privilege="SELECT"):
+    return rf.GrantEntry(
+        grantee=grantee,
+        privileges=(privilege,),
+        object_name=object_name,
+        statement=f"GRANT {privilege} ON {object_name} TO {grantee};",
+        source_path=Path(f"{grantee}.grants.sql"),
+        grant_type="OBJECT",
+    )
+
+
+class GrantEntryTests(unittest.TestCase):
+    def test_copy_and_pickle_round_trip(self):
+        entry = _grant_entry("U1", "A.T1")
+
+        for clone in (
+            copy.copy(entry),
+            copy.deepcopy(entry),
+            pickle.loads(pickle.dumps(entry)),
+        ):
+            self.assertEqual(clone, entry)
+            self.assertEqual(hash(clone), hash(entry))
+        self.assertFalse(hasattr(entry, "__dict__"))
+
+
+class GrantNameSuffixLookupTests(unittest.TestCase):
+    def setUp(self):
+        self.a_t1 = _grant_entry("U1", "A.T1")
+        self.b_t1 = _grant_entry("U1", "B.T1", "INSERT")
+        self.dotted_t1 = _grant_entry("U1", "C.X.T1")
+        self.a_xt1 = _grant_entry("U1", "A.XT1")
+        self.other_grantee = _grant_entry("U2", "A.T1")
+        entries = [self.a_t1, self.b_t1, self.dotted_t1, self.a_xt1, self.other_grantee]
+        by_grantee_object = {}
+        for entry in entries:
+            by_grantee_object.setdefault((entry.grantee, entry.object_name), []).append(entry)
+        self.grant_index = rf.GrantIndex(
+            by_grantee_object=rf.freeze_grant_buckets(by_grantee_object),
+            by_object={},
+            by_grantee_sys={},
+        )
+
+    def test_exact_owner_match_skips_suffix_index(self):
+        entries = rf.select_grant_entries(self.grant_index, "U1", "B", "T1", None)
+
+        self.assertEqual(list(entries), [self.b_t1])
+        self.assertIsNone(self.grant_index.by_grantee_name_suffix)
+
+    def test_view_schema_match_is_tried_before_name_fallback(self):
+        entries = rf.select_grant_entries(self.grant_index, "U1", "Z", "T1", "A")
+
+        self.assertEqual(list(entries), [self.a_t1])
+        self.assertIsNone(self.grant_index.by_grantee_name_suffix)
+
+    def test_name_fallback_matches_every_dotted_suffix_for_grantee(self):
+        entries = rf.select_grant_entries(self.grant_index, "U1", "Z", "T1", None)
+
+        # 与原先按 obj_key.endswith(".T1") 全量扫描的结果及顺序一致
+        self.assertEqual(list(entries), [self.a_t1, self.b_t1, self.dotted_t1])
+        self.assertEqual(
+            list(rf.select_grant_entries(self.grant_index, "U1", None, "X.T1", None)),
+            [self.dotted_t1],
+        )
+        self.assertEqual(
+            list(rf.select_grant_entries(self.grant_index, "U2", None, "T1", None)),
+            [self.other_grantee],
+        )
+        self.assertEqual(list(rf.select_grant_entries(self.grant_index, "U1", None, "T", None)), [])
+
+    def test_suffix_index_is_built_once_and_reused(self):
+        rf.select_grant_entries(self.grant_index, "U1", None, "T1", None)
+        suffix_index = self.grant_index.by_grantee_name_suffix
+        self.assertIsNotNone(suffix_index)
+
+        rf.select_grant_entries(self.grant_index, "U1", None, "XT1", None)
+
+        self.assertIs(self.grant_index.by_grantee_name_suffix, suffix_index)
+
+
+class RecompileInvalidObjectsTests(unittest.TestCase):
+    def test_each_object_is_compiled_in_its_own_call(self):
+        invalid_rounds = [
+            [
+                ("APP", "P_OK", "PROCEDURE"),
+                ("APP", "P_BAD", "PROCEDURE"),
+                ("APP", "V1", "VIEW"),
+            ],
+            [],
+        ]
+        executed_sql = []
+
+        def fake_run_sql(_cmd, sql_text, _timeout):
+            executed_sql.append(sql_text)
+            stdout = "ORA-24344: success with compilation error" if "P_BAD" in sql_text else ""
+            return subprocess.CompletedProcess(["obclient"], 0, stdout=stdout, stderr="")
+
+        with mock.patch.object(
+            rf, "query_invalid_objects", side_effect=invalid_rounds
+        ), mock.patch.object(rf, "run_sql", side_effect=fake_run_sql), mock.patch.object(
+            rf, "is_object_invalid", return_value=False
+        ) as status_check:
+            summary = rf.recompile_invalid_objects(["obclient"], 10)
+
+        # 每个可编译对象单独一次 obclient 调用，失败只归属到自身；VIEW 不下发 COMPILE
+        self.assertEqual(len(executed_sql), 2)
+        self.assertTrue(all(sql.count("COMPILE") == 1 for sql in executed_sql))
+        self.assertIn("P_OK", executed_sql[0])
+        self.assertIn("P_BAD", executed_sql[1])
+        self.assertEqual(status_check.call_count, 1)
+        self.assertEqual(summary, rf.RecompileSummary(1, 0, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
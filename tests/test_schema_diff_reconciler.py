@@ -0,0 +1,163 @@
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+try:  # pragma: no cover
+    import oracledb  # noqa: F401
+except ImportError:  # pragma: no cover
+    dummy_oracledb = types.ModuleType("oracledb")
+
+    class _DummyConnection:  # pragma: no cover
+        pass
+
+    def _dummy_connect(*_args, **_kwargs):  # pragma: no cover
+        raise RuntimeError("dummy oracledb.connect called")
+
+    dummy_oracledb.Connection = _DummyConnection
+    dummy_oracledb.connect = _dummy_connect
+    dummy_oracledb.Error = Exception
+    sys.modules["oracledb"] = dummy_oracledb
+
+import schema_diff_reconciler as sdr
+
+
+class ExportObjectMappingArtifactsTests(unittest.TestCase):
+    def setUp(self):
+        self.managed = {"A.T1": {"TABLE": "B.T1"}}
+        self.discovery = {
+            "A.T1": {"TABLE": "B.T1"},
+            "A.V1": {"VIEW": "B.V1"},
+        }
+
+    def _export(self, report_dir, include_managed_mapping):
+        return sdr.export_object_mapping_artifacts(
+            self.managed,
+            self.discovery,
+            report_dir / "object_mapping_TS.txt",
+            report_dir / "object_mapping_discovery_TS.txt",
+            include_managed_mapping=include_managed_mapping,
+        )
+
+    def test_managed_and_discovery_only_mappings_are_exported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report_dir = Path(tmp)
+            discovery_path, diagnostics = self._export(report_dir, True)
+
+            self.assertEqual(
+                (report_dir / "object_mapping_TS.txt").read_text(encoding="utf-8"),
+                "A.T1\tTABLE\tB.T1\n",
+            )
+            self.assertEqual(discovery_path, report_dir / "object_mapping_discovery_TS.txt")
+            self.assertEqual(discovery_path.read_text(encoding="utf-8"), "A.V1\tVIEW\tB.V1\n")
+            self.assertEqual(
+                diagnostics,
+                [
+                    "discovery-only mapping objects=1; types=VIEW; "
+                    "detail=object_mapping_discovery_TS.txt"
+                ],
+            )
+
+    def test_empty_master_list_still_exports_discovery_only_mapping_and_diagnostics(self):
+        self.managed = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            report_dir = Path(tmp)
+            discovery_path, diagnostics = self._export(report_dir, False)
+
+            self.assertFalse((report_dir / "object_mapping_TS.txt").exists())
+            self.assertEqual(
+                discovery_path.read_text(encoding="utf-8"),
+                "A.T1\tTABLE\tB.T1\nA.V1\tVIEW\tB.V1\n",
+            )
+            self.assertEqual(
+                diagnostics,
+                [
+                    "discovery-only mapping objects=2; types=TABLE, VIEW; "
+                    "detail=object_mapping_discovery_TS.txt"
+                ],
+            )
+
+
+
+class ComputeObjectCountsTests(unittest.TestCase):
+    def test_per_type_counts_on_mixed_type_fixture(self):
+        full_object_mapping = {
+            "SRC.T1": {"TABLE": "TGT.T1"},
+            "SRC.T2": {"TABLE": "TGT.T2"},
+            "SRC.V1": {"VIEW": "TGT.V1"},
+            "SRC.PKG_OK": {"PACKAGE": "TGT.PKG_OK"},
+            "SRC.PKG_BAD": {"PACKAGE": "TGT.PKG_BAD"},
+        }
+        oracle_meta = types.SimpleNamespace(
+            object_statuses={("SRC", "PKG_BAD", "PACKAGE"): "INVALID"},
+            contexts={"CTX_A": {}, "CTX_B": {}},
+            constraints={
+                ("SRC", "T1"): {
+                    "PK_T1": {"type": "P"},
+                    "CK_T1": {"type": "C"},
+                    "X_T1": {"type": "O"},
+                },
+                ("SRC", "T2"): {"FK_T2": {"type": "R"}},
+            },
+            indexes={("SRC", "T1"): {"IX1": {}, "IX2": {}}},
+        )
+        ob_meta = types.SimpleNamespace(
+            objects_by_type={
+                "TABLE": {"tgt.t1", "TGT.T3"},
+                "VIEW": {"TGT.V1"},
+                "PACKAGE": {"TGT.PKG_OK", "TGT.PKG_BAD"},
+            },
+            contexts={"ctx_a": {}, "CTX_C": {}},
+            constraints={("TGT", "T1"): {"PK_T1": {"type": "P"}}},
+            indexes={("TGT", "T1"): {"IX1": {}, "IX2": {}, "IX3": {}}},
+        )
+
+        summary = sdr.compute_object_counts(
+            full_object_mapping,
+            ob_meta,
+            oracle_meta,
+            monitored_types=("TABLE", "VIEW", "PACKAGE", "CONTEXT", "CONSTRAINT", "INDEX"),
+        )
+
+        self.assertEqual(
+            summary,
+            {
+                "oracle": {
+                    "TABLE": 2,
+                    "VIEW": 1,
+                    "PACKAGE": 1,
+                    "CONTEXT": 2,
+                    "CONSTRAINT": 3,
+                    "INDEX": 2,
+                },
+                "oceanbase": {
+                    "TABLE": 1,
+                    "VIEW": 1,
+                    "PACKAGE": 1,
+                    "CONTEXT": 1,
+                    "CONSTRAINT": 1,
+                    "INDEX": 3,
+                },
+                "missing": {
+                    "TABLE": 1,
+                    "VIEW": 0,
+                    "PACKAGE": 0,
+                    "CONTEXT": 1,
+                    "CONSTRAINT": 2,
+                    "INDEX": 0,
+                },
+                "extra": {
+                    "TABLE": 1,
+                    "VIEW": 0,
+                    "PACKAGE": 0,
+                    "CONTEXT": 1,
+                    "CONSTRAINT": 0,
+                    "INDEX": 1,
+                },
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()